@@ -8,13 +8,13 @@ from __future__ import annotations
 
 __version__ = "2.2.1"
 
+import copy
 import reprlib
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     ClassVar,
-    DefaultDict,
     Iterable,
     Iterator,
     MutableMapping,
@@ -22,6 +22,7 @@ from typing import (
     Sequence,
     Type,
     TypeVar,
+    ValuesView,
     overload,
 )
 
@@ -33,6 +34,69 @@ T = TypeVar("T")
 ComponentDictObserver = Callable[["ComponentDict", Type[T], Optional[T], Optional[T]], None]
 _ComponentDictObserver = Callable[["ComponentDict", Optional[T], Optional[T]], None]
 
+_COMPONENT_KEYS: dict[type[Any], type[Any]] = {}
+"""A cache of component classes to the key their instances are stored with in a ComponentDict.
+
+This holds strong references to every component class assigned, so classes created at runtime are never freed.
+A :any:`weakref.WeakKeyDictionary` was not used since it would make every lookup much slower.
+"""
+
+_ABSTRACT_COMPONENTS: set[type[Any]] = set()
+"""The classes registered with :any:`abstract_component`."""
+
+
+def _component_key(cls: type[Any]) -> type[Any]:
+    """Return the ComponentDict key for instances of `cls`, resolving abstract components only once per class."""
+    key = _COMPONENT_KEYS.get(cls)
+    if key is None:
+        key = _COMPONENT_KEYS[cls] = getattr(cls, "_COMPONENT_TYPE", cls)
+    return key
+
+
+def _assert_key(key: type[Any]) -> None:
+    """Assert that this key is either an abstract component or an anonymous component."""
+    if _ABSTRACT_COMPONENTS:  # Without abstract components every class is its own key.
+        real_key = getattr(key, "_COMPONENT_TYPE", key)  # Not cached, keys which are only looked up are not kept.
+        assert (
+            real_key is key
+        ), f"{key!r} is a child of an abstract component and can only be accessed with {real_key!r}."
+
+
+_PICKLED_SLOTS: dict[type[Any], tuple[str, ...]] = {}
+"""A cache of classes to the names of their slots which are saved when pickled.
+
+Like ``_COMPONENT_KEYS`` this holds strong references, so pickled subclasses created at runtime are never freed.
+"""
+
+
+def _pickled_slots(cls: type[Any]) -> tuple[str, ...]:
+    """Return the slots of `cls` and its parent classes which should be pickled, this may include ``__dict__``."""
+    slots = _PICKLED_SLOTS.get(cls)
+    if slots is None:
+        slots = _PICKLED_SLOTS[cls] = tuple(
+            attr for parent in cls.__mro__ for attr in getattr(parent, "__slots__", ()) if attr != "__weakref__"
+        )
+    return slots
+
+
+_NO_COMPONENTS: tuple[Any, ...] = ()
+"""The default components, compared by identity to skip assigning components to a new ComponentDict."""
+
+_REDUCE_METHODS = ("__reduce__", "__reduce_ex__", "__getnewargs__", "__getnewargs_ex__")
+"""Methods which subclasses can override to customize how they are pickled and copied."""
+
+
+def _index_identical(items: Sequence[Any], obj: object) -> int:
+    """Return the index of `obj` in `items`, preferring the identical object over any equal objects before it.
+
+    Raises ValueError if `obj` is not in `items`.
+    """
+    index = items.index(obj)
+    for i in range(index, len(items)):  # The items before `index` are neither equal nor identical to `obj`.
+        if items[i] is obj:
+            return i
+    return index
+
 
 def abstract_component(cls: type[T]) -> type[T]:
     """Register class `cls` as an abstract component and return it.
@@ -68,6 +132,9 @@ def abstract_component(cls: type[T]) -> type[T]:
         Derived()
     """
     cls._COMPONENT_TYPE = cls  # type: ignore[attr-defined]
+    _COMPONENT_KEYS.clear()  # Subclasses of `cls` may have already been cached.
+    _COMPONENT_KEYS[cls] = cls
+    _ABSTRACT_COMPONENTS.add(cls)
     return cls
 
 
@@ -145,11 +212,14 @@ class ComponentDict(MutableMapping[Type[Any], Any]):
         Is now a :any:`collections.abc.MutableMapping` and has all of the relevant methods such as ``.values()``.
     """
 
-    __slots__ = ("_components", "observers", "__weakref__")
+    __slots__ = ("_components", "_observers", "__weakref__")
 
     _components: dict[type[Any], Any]
     """The actual components stored in a dictionary.  The indirection is needed to make type hints work."""
 
+    _observers: dict[type[Any], list[_ComponentDictObserver[Any]]] | None
+    """The local observers, this is None until observers are assigned or accessed."""
+
     global_observers: ClassVar[list[ComponentDictObserver[Any]]] = []
     '''A class variable list of functions to call with component changes.
 
@@ -178,9 +248,22 @@ class ComponentDict(MutableMapping[Type[Any], Any]):
         Use :any:`clear` when you are finished with an entity and want its components observed as being deleted.
     '''
 
+    _assign_at_once: ClassVar[bool] = True
+    """True if this class does not override :any:`set` or ``__setitem__``, set for each subclass."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Check if the subclass overrides how components are assigned."""
+        super().__init_subclass__(**kwargs)
+        cls._assign_at_once = cls.set is ComponentDict.set and cls.__setitem__ is ComponentDict.__setitem__
+        if cls.__copy__ is ComponentDict.__copy__ and any(
+            getattr(cls, name, None) is not getattr(ComponentDict, name, None) for name in _REDUCE_METHODS
+        ):  # Copy subclasses which customize the reduce protocol through that protocol, the same as pickle.
+            cls.__copy__ = None  # type: ignore[assignment]
+            cls.__deepcopy__ = None  # type: ignore[assignment]
+
     def __init__(
         self,
-        components: Iterable[object] = (),
+        components: Iterable[object] = _NO_COMPONENTS,
         observers: dict[type[Any], list[_ComponentDictObserver[Any]]] | None = None,
     ) -> None:
         """Initialize a ComponentDict.
@@ -196,21 +279,27 @@ class ComponentDict(MutableMapping[Type[Any], Any]):
         .. versionchanged:: 2.2
             Added `observers` parameter.
         """
-        self.observers: dict[type[Any], list[_ComponentDictObserver[Any]]] = {} if observers is None else observers
+        self._observers = observers
+        self._components = {}
+        if components is not _NO_COMPONENTS:  # Not a truth test, iterables such as NumPy arrays can't be tested.
+            self._set_initial(components)
+
+    @property
+    def observers(self) -> dict[type[Any], list[_ComponentDictObserver[Any]]]:
         """A dictionary of a list of component observers.
 
         .. versionadded:: 2.2
+
+        .. versionchanged:: 2.3
+            The dictionary is not allocated until it is first accessed.
         """
-        self._components = {}
-        self.set(*components)
+        if self._observers is None:
+            self._observers = {}
+        return self._observers
 
-    @staticmethod
-    def __assert_key(key: T) -> None:
-        """Assert that this key is either an abstract component or an anonymous component."""
-        real_key = getattr(key, "_COMPONENT_TYPE", key)
-        assert (
-            real_key is key
-        ), f"{key!r} is a child of an abstract component and can only be accessed with {real_key!r}."
+    @observers.setter
+    def observers(self, observers: dict[type[Any], list[_ComponentDictObserver[Any]]]) -> None:
+        self._observers = observers
 
     def set(self, *components: object) -> Self:
         """Assign or replace the components of this entity and return self.
@@ -219,16 +308,49 @@ class ComponentDict(MutableMapping[Type[Any], Any]):
             Now returns self.
         """
         for component in components:
-            self[getattr(component, "_COMPONENT_TYPE", component.__class__)] = component
+            self[_component_key(component.__class__)] = component
+        return self
+
+    def set_many(self, components: Iterable[object]) -> Self:
+        """Assign or replace the components from an iterable and return self.
+
+        This is the same as :any:`set` but does not need the components to be unpacked into arguments.
+
+        .. versionadded:: 2.3
+        """
+        setitem = self.__setitem__
+        for component in components:
+            setitem(_component_key(component.__class__), component)
         return self
 
+    def set_one(self, component: T) -> T:
+        """Assign or replace a single component and return that component.
+
+        This is faster than :any:`set` when only one component is being assigned and should be preferred in hot loops.
+
+        .. versionadded:: 2.3
+        """
+        self[_component_key(component.__class__)] = component
+        return component
+
+    def _set_initial(self, components: Iterable[object]) -> None:
+        """Assign the components of a new or unpickled object.
+
+        Components are assigned all at once unless there are observers or overrides of :any:`set` to call.
+        """
+        if self._assign_at_once and not self.global_observers and not self._observers:
+            self._components.update({_component_key(component.__class__): component for component in components})
+        else:
+            self.set(*components)
+
     def __getitem__(self, key: type[T]) -> T:
         """Return a component of type, raises KeyError if it doesn't exist."""
         if __debug__:
-            self.__assert_key(key)
-        value = self._components.get(key)
-        if value is not None:
-            return value  # type: ignore[no-any-return]  # Cast to T.
+            _assert_key(key)
+        try:
+            return self._components[key]  # type: ignore[no-any-return]  # Cast to T.
+        except KeyError:
+            pass
         return self.__missing__(key)
 
     def __setstate__(self, state: Any | dict[str, Any]) -> None:  # noqa: ANN401
@@ -247,7 +369,7 @@ class ComponentDict(MutableMapping[Type[Any], Any]):
         if isinstance(components, dict):  # Convert v1.1 _components attribute into instance list.
             components = components.values()
 
-        observers = {}
+        observers = None
         if "observers" in dict_state:  # Missing from old objects.
             observers = dict_state["observers"]
             del dict_state["observers"]
@@ -256,27 +378,55 @@ class ComponentDict(MutableMapping[Type[Any], Any]):
             setattr(self, attr, value)
 
         # Unpack components with global side-effects.
-        self.observers = {}
+        self._observers = None
         self._components = {}
-        self.set(*components)
-        self.observers = observers
+        self._set_initial(components)
+        self._observers = observers
 
     def __getstate__(self) -> dict[str, Any]:
         """Pickle this instance.  Any subclass slots and dict attributes will also be saved."""
         state: dict[str, Any] = {}
-        for cls in self.__class__.__mro__:
-            for attr in getattr(cls, "__slots__", ()):
-                if not hasattr(self, attr):
-                    continue
-                if attr == "__weakref__":
-                    continue
+        if self.__class__ is not ComponentDict:  # Only subclasses can have other slots or a __dict__ to save.
+            for attr in _pickled_slots(self.__class__):
                 if attr == "__dict__":
                     state.update(self.__dict__)
-                    continue
-                state[attr] = getattr(self, attr)
-        state["_components"] = tuple(state["_components"].values())
+                elif hasattr(self, attr):
+                    state[attr] = getattr(self, attr)
+            state.pop("_observers", None)
+        state["_components"] = tuple(self._components.values())
+        if self._observers is not None:  # Saved under the name used before observers were allocated lazily.
+            state["observers"] = self._observers
         return state
 
+    def copy(self) -> Self:
+        """Return a shallow copy of this ComponentDict.
+
+        This is the same as :any:`copy.copy`.
+        The global observers will see the components of the copy as newly assigned, but local observers are not called.
+
+        .. versionadded:: 2.3
+        """
+        return copy.copy(self)
+
+    def __copy__(self) -> Self:
+        """Return a shallow copy of this object made from its pickled state, skipping the reduce protocol.
+
+        This is removed from subclasses which customize the reduce protocol so that :any:`copy.copy` uses it instead.
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.__setstate__(self.__getstate__())
+        return new
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        """Return a deep copy of this object made from its pickled state, skipping the reduce protocol.
+
+        This is removed from subclasses which customize the reduce protocol so that :any:`copy.deepcopy` uses it instead.
+        """
+        new = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new
+        new.__setstate__(copy.deepcopy(self.__getstate__(), memo))
+        return new
+
     def __missing__(self, key: type[T]) -> T:
         '''Raise KeyError with the missing key.  Called when a key is missing.
 
@@ -294,25 +444,36 @@ class ComponentDict(MutableMapping[Type[Any], Any]):
 
     def __setitem__(self, key: type[T], value: T) -> None:
         """Set or replace a component."""
-        valid_key = getattr(value, "_COMPONENT_TYPE", value.__class__)
+        valid_key = _component_key(value.__class__)
         if key is not valid_key:
             msg = f"{value!r} is being assigned to {key!r} but it belongs to {valid_key!r} instead!"
             raise TypeError(msg)
+        global_observers = self.global_observers
+        observers = self._observers
+        if not global_observers and (observers is None or key not in observers):
+            self._components[key] = value  # Skip fetching the old value when nothing observes it.
+            return
         old_value = self._components.get(key)
         self._components[key] = value
-        for global_observer in self.global_observers:
+        for global_observer in global_observers:
             global_observer(self, key, value, old_value)
-        for local_observer in self.observers.get(key, ()):
-            local_observer(self, value, old_value)
+        if self._observers is not None:
+            for local_observer in self._observers.get(key, ()):
+                local_observer(self, value, old_value)
 
     def __delitem__(self, key: type[object]) -> None:
         """Delete a component."""
-        old_value = self._components[key]
-        del self._components[key]
-        for global_observer in self.global_observers:
+        global_observers = self.global_observers
+        observers = self._observers
+        if not global_observers and (observers is None or key not in observers):
+            del self._components[key]
+            return
+        old_value = self._components.pop(key)
+        for global_observer in global_observers:
             global_observer(self, key, None, old_value)
-        for local_observer in self.observers.get(key, ()):
-            local_observer(self, None, old_value)
+        if self._observers is not None:
+            for local_observer in self._observers.get(key, ()):
+                local_observer(self, None, old_value)
 
     def __contains__(self, keys: type[object] | Iterable[type[object]]) -> bool:  # type: ignore[override]
         """Return true if the types of component exist in this entity.  Takes a single type or an iterable of types.
@@ -321,11 +482,25 @@ class ComponentDict(MutableMapping[Type[Any], Any]):
             Now supports checking multiple types at once.
         """
         if isinstance(keys, type):
-            keys = (keys,)
-        if __debug__:
-            for key in keys:
-                self.__assert_key(key)
-        return all(key in self._components for key in keys)
+            if __debug__:
+                _assert_key(keys)
+            return keys in self._components
+        components = self._components
+        for key in keys:
+            if __debug__:
+                _assert_key(key)
+            if key not in components:
+                return False
+        return True
+
+    def has(self, key: type[object]) -> bool:
+        """Return True if a component of type `key` exists in this entity.
+
+        Unlike ``key in entity`` this only takes a single type and skips the debug check against abstract components.
+
+        .. versionadded:: 2.3
+        """
+        return key in self._components
 
     def __len__(self) -> int:
         """Return the number of components contained in this object."""
@@ -335,6 +510,13 @@ class ComponentDict(MutableMapping[Type[Any], Any]):
         """Iterate over the keys of this container."""
         return iter(self._components)
 
+    def values(self) -> ValuesView[Any]:
+        """Return a view of the components in this container.
+
+        The :any:`keys` and :any:`items` views are inherited so that membership tests go through this container.
+        """
+        return self._components.values()
+
     # Use identity comparison and hashing.
     __hash__ = object.__hash__
     __eq__ = object.__eq__
@@ -343,10 +525,10 @@ class ComponentDict(MutableMapping[Type[Any], Any]):
     @reprlib.recursive_repr()
     def __repr__(self) -> str:
         """Return the representation of this ComponentDict."""
-        params = [f"[{', '.join(repr(component) for component in self._components.values())}]"]
-        if self.observers:
-            params.append(f"observers={self.observers!r}")
-        return f"{self.__class__.__name__}({', '.join(params)})"
+        params = [f"[{', '.join([repr(component) for component in self._components.values()])}]"]
+        if self._observers:
+            params.append(f"observers={self._observers!r}")
+        return f"{type(self).__name__}({', '.join(params)})"
 
     if TYPE_CHECKING:
 
@@ -422,29 +604,57 @@ class Composite:
         Args:
             components: An iterable of objects.
         """
-        self._components = DefaultDict(list)
-        for obj in components:
-            self.add(obj)
+        self._components = {}
+        self.extend(components)
 
     def add(self, component: object) -> None:
         """Add a component to this container."""
+        components = self._components
         for component_class in component.__class__.__mro__:
-            self._components[component_class].append(component)
+            bucket = components.get(component_class)
+            if bucket is None:
+                components[component_class] = bucket = []
+            bucket.append(component)
 
     def extend(self, components: Iterable[object]) -> None:
         """Add multiple components to this container."""
+        if type(self).add is not Composite.add:  # Subclasses overriding add must see every component.
+            add = self.add
+            for component in components:
+                add(component)
+            return
+        components_dict = self._components
+        appenders: dict[type[Any], list[Callable[[object], None]]] = {}  # The list appends of each class of component.
         for component in components:
-            self.add(component)
+            component_class = component.__class__
+            class_appenders = appenders.get(component_class)
+            if class_appenders is None:
+                class_appenders = appenders[component_class] = [
+                    components_dict.setdefault(parent, []).append for parent in component_class.__mro__
+                ]
+            for append in class_appenders:
+                append(component)
 
     def remove(self, component: object) -> None:
         """Remove a component from this container.
 
         Will raise ValueError if the component was not present.
         """
-        for component_class in component.__class__.__mro__:
-            self._components[component_class].remove(component)
-            if not self._components[component_class]:
-                del self._components[component_class]
+        components = self._components
+        candidates = components.get(component.__class__, ())
+        index = candidates.index(component)  # Identity is checked before equality, so this is usually `component`.
+        if candidates[index] is not component:
+            index = _index_identical(candidates, component)  # The stored instance might only be equal to `component`.
+        stored = candidates[index]
+        for component_class in stored.__class__.__mro__:
+            bucket = components[component_class]
+            if bucket is not candidates:  # The index in `candidates` is already known.
+                index = bucket.index(stored)
+                if bucket[index] is not stored:
+                    index = _index_identical(bucket, stored)
+            del bucket[index]
+            if not bucket:
+                del components[component_class]
 
     def clear(self) -> None:
         """Clear all components from this container."""
@@ -465,24 +675,37 @@ class Composite:
     def __setitem__(self, key: type[T], values: Iterable[T]) -> None:
         """Replace all instances of `key` with the instances of `values`."""
         del self[key]
-        for obj in values:
-            self.add(obj)
+        self.extend(values)
 
     def __delitem__(self, key: type[object]) -> None:
         """Remove all instances of `key` if they exist."""
-        if key not in self._components:
+        components = self._components
+        removed = components.get(key)
+        if removed is None:
+            return
+        if type(self).remove is not Composite.remove:  # Subclasses overriding remove must see every removal.
+            for obj in list(removed):
+                self.remove(obj)
             return
-        for obj in list(self._components[key]):
-            self.remove(obj)
+        removed_ids = {id(obj) for obj in removed}
+        for component_class in {parent for obj in removed for parent in obj.__class__.__mro__}:
+            bucket = components[component_class]
+            bucket[:] = [obj for obj in bucket if id(obj) not in removed_ids]  # Remove by identity, in one pass.
+            if not bucket:
+                del components[component_class]
 
     def __contains__(self, keys: type[object] | Iterable[type[object]]) -> bool:
         """Return true if all types or sub-types of `keys` exist in this entity.
 
         Takes a single type or an iterable of types.
         """
+        components = self._components
         if isinstance(keys, type):
-            keys = (keys,)
-        return all(key in self._components for key in keys)
+            return keys in components
+        for key in keys:  # noqa: SIM110  # An explicit loop is faster than all() with a generator.
+            if key not in components:
+                return False
+        return True
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         """Unpickle instances of this object.
@@ -496,28 +719,23 @@ class Composite:
             setattr(self, attr, value)
 
         # Unpack components with side-effects.
-        self._components = DefaultDict(list)
-        for component in components:
-            self.add(component)
+        self._components = {}
+        self.extend(components)
 
     def __getstate__(self) -> dict[str, Any]:
         """Pickle this instance.  Any subclass slots and dict attributes will also be saved."""
         state: dict[str, Any] = {}
-        for cls in self.__class__.__mro__:
-            for attr in getattr(cls, "__slots__", ()):
-                if not hasattr(self, attr):
-                    continue
-                if attr == "__weakref__":
-                    continue
+        if self.__class__ is not Composite:  # Only subclasses can have other slots or a __dict__ to save.
+            for attr in _pickled_slots(self.__class__):
                 if attr == "__dict__":
                     state.update(self.__dict__)
-                    continue
-                state[attr] = getattr(self, attr)
+                elif hasattr(self, attr):
+                    state[attr] = getattr(self, attr)
         state["_components"] = self._components.get(object, ())
         return state
 
     @reprlib.recursive_repr()
     def __repr__(self) -> str:
         """Return the representation of this Composite."""
-        components = ", ".join(repr(component) for component in self._components.get(object, ()))
-        return f"""{self.__class__.__name__}([{components}])"""
+        components = ", ".join([repr(component) for component in self._components.get(object, ())])
+        return f"""{type(self).__name__}([{components}])"""
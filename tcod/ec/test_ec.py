@@ -2,10 +2,11 @@ from __future__ import annotations
 
 import copy
 import pickle
-from typing import Iterable, TypeVar
+from typing import Any, Iterable, Iterator, TypeVar
 
 import attrs
 import pytest
+from typing_extensions import Self
 
 import tcod.ec
 
@@ -72,6 +73,11 @@ def test_ComponentDict() -> None:
     entity = tcod.ec.ComponentDict([derived, foo])
     assert Base in entity
     assert Foo in entity
+    assert entity.has(Foo)
+    assert not entity.has(Missing)
+    assert {Base, Foo} in entity  # type: ignore[comparison-overlap]
+    assert {Base, Missing} not in entity  # type: ignore[comparison-overlap]
+    assert iter([Foo, Missing]) not in entity  # type: ignore[comparison-overlap]
     assert set(entity) == {Base, Foo}
     assert repr(entity) == "ComponentDict([Derived(), Foo()])"
     assert entity[Base] is derived
@@ -109,11 +115,72 @@ def test_ComponentDict() -> None:
     assert entity.get(Base) is base
 
     assert entity.set() is entity
+    assert entity.set_one(derived) is derived
+    assert entity[Base] is derived
+    assert entity.set_many(iter([base, foo])) is entity
+    assert entity[Base] is base
+    assert entity[Foo] is foo
 
     entity = tcod.ec.ComponentDict([base])
     entity.clear()
     assert list(entity) == []
 
+    entity = tcod.ec.ComponentDict([None])
+    assert entity[type(None)] is None
+
+
+class AmbiguousList(list):  # type: ignore[type-arg]
+    """A list without a truth value, like a NumPy array."""
+
+    def __bool__(self) -> bool:
+        """Raise ValueError, the truth value is ambiguous."""
+        raise ValueError
+
+
+def test_ComponentDict_ambiguous_iterable() -> None:
+    assert Foo in tcod.ec.ComponentDict(AmbiguousList([foo]))
+
+
+def test_ComponentDict_setitem_override() -> None:
+    assigned: list[object] = []
+
+    class SetItemHook(tcod.ec.ComponentDict):
+        __slots__ = ()
+
+        def __setitem__(self, key: type[T], value: T) -> None:
+            assigned.append(value)
+            super().__setitem__(key, value)
+
+    entity = SetItemHook([foo])
+    entity.set(derived)
+    entity.set_many([foo])
+    assert assigned == [foo, derived, foo]
+
+
+def test_ComponentDict_set_override() -> None:
+    assigned: list[object] = []
+
+    class SetHook(tcod.ec.ComponentDict):
+        __slots__ = ()
+
+        def set(self, *components: object) -> Self:
+            assigned.extend(components)
+            return super().set(*components)
+
+    entity = SetHook([foo, derived])
+    assert assigned == [foo, derived]
+    copy.copy(entity)
+    copy.deepcopy(entity)
+    assert assigned == [foo, derived] * 3
+
+
+def test_ComponentDict_views() -> None:
+    entity = tcod.ec.ComponentDict([derived, foo])
+    assert {Foo} in entity.keys()  # type: ignore[comparison-overlap]  # noqa: SIM118
+    assert {Base, Foo} in entity.keys()  # type: ignore[comparison-overlap]  # noqa: SIM118
+    assert (Base, derived) in entity.items()
+    assert list(entity.values()) == [derived, foo]
+
 
 def test_ComponentDict_recursive() -> None:
     entity = tcod.ec.ComponentDict()
@@ -139,6 +206,51 @@ def test_ComponentDict_pickle_subclass() -> None:
     clone.name = "Copy"
     assert entity.name != clone.name
 
+    clone = entity.copy()
+    assert clone.name == entity.name
+    assert repr(clone) == "ComponentDictNode([Derived(), Foo()])"
+
+
+class NamedComponentDict(tcod.ec.ComponentDict):
+    """Subclass with a required __new__ argument for testing copies."""
+
+    __slots__ = ("name",)
+    name: str
+
+    def __new__(cls, name: str, components: Iterable[object] = ()) -> Self:
+        """Require a name, copies must pass it with __getnewargs__."""
+        self = super().__new__(cls)
+        self.name = name
+        return self
+
+    def __init__(self, name: str, components: Iterable[object] = ()) -> None:
+        super().__init__(components)
+
+    def __getnewargs__(self) -> tuple[str]:
+        """Pass the name to __new__."""
+        return (self.name,)
+
+
+def test_ComponentDict_copy_reduce() -> None:
+    entity = NamedComponentDict("Top", [foo])
+    for clone in (copy.copy(entity), copy.deepcopy(entity), entity.copy(), pickle.loads(pickle.dumps(entity))):
+        assert clone.name == "Top"
+        assert repr(clone) == "NamedComponentDict([Foo()])"
+
+    reduced: list[tcod.ec.ComponentDict] = []
+
+    class ReduceHook(tcod.ec.ComponentDict):
+        __slots__ = ()
+
+        def __reduce__(self) -> tuple[Any, ...]:
+            reduced.append(self)
+            return (ReduceHook, (list(self.values()),))
+
+    hooked = ReduceHook([foo])
+    assert repr(copy.copy(hooked)) == "ReduceHook([Foo()])"
+    assert repr(copy.deepcopy(hooked)) == "ReduceHook([Foo()])"
+    assert reduced == [hooked, hooked]
+
 
 def test_ComponentDict_unpickle_v1_1() -> None:
     # Makes sure v1.1 ComponentDict is unpicklable.
@@ -169,15 +281,53 @@ def test_ComponentDict_copy() -> None:
         deep = copy.deepcopy(original)
         assert original[Foo] == deep[Foo]
         assert original[Foo] is not deep[Foo]
+        method = original.copy()
+        assert original[Foo] is method[Foo]
+        assert original is not method
 
         # Copying triggers observable side-effects.
         assert Foo in caught[original]
         assert Foo in caught[shallow]
         assert Foo in caught[deep]
+        assert Foo in caught[method]
     finally:
         tcod.ec.ComponentDict.global_observers.remove(_catch_components)
 
 
+_foo_changes: list[tuple[Foo | None, Foo | None]] = []
+
+
+def _observe_foo(entity: tcod.ec.ComponentDict, value: Foo | None, old_value: Foo | None) -> None:
+    _foo_changes.append((value, old_value))
+
+
+def test_ComponentDict_observers() -> None:
+    _foo_changes.clear()
+    entity = tcod.ec.ComponentDict([foo])
+    assert entity.observers == {}
+    entity.observers[Foo] = [_observe_foo]
+    entity[Foo] = foo
+    del entity[Foo]
+    assert _foo_changes == [(foo, foo), (None, foo)]
+
+    clone = pickle.loads(pickle.dumps(entity))
+    assert clone.observers == {Foo: [_observe_foo]}
+    clone = pickle.loads(pickle.dumps(tcod.ec.ComponentDict([foo])))
+    assert clone.observers == {}
+
+    observers: dict[type[Any], list[Any]] = {}
+    entity = tcod.ec.ComponentDict(observers=observers)
+    assert entity.observers is observers
+    entity.observers = {}
+    assert entity.observers is not observers
+
+    # An empty observers dict is still shared by reference when copied or pickled.
+    entity = tcod.ec.ComponentDict([foo], observers=observers)
+    assert copy.copy(entity).observers is observers
+    clone_a, clone_b = pickle.loads(pickle.dumps([entity, tcod.ec.ComponentDict(observers=observers)]))
+    assert clone_a.observers is clone_b.observers
+
+
 def _migrate_derived(entity: tcod.ec.ComponentDict, key: type[T], value: T | None, old_value: T | None) -> None:
     """Convert Base and Derived to being held by Abstract."""
     if isinstance(value, Base):
@@ -198,6 +348,7 @@ def test_Composite() -> None:
     entity = tcod.ec.Composite([base, derived])
     assert Base in entity
     assert {Base, Derived} in entity
+    assert {Base, Foo} not in entity
     assert list(entity[Base]) == [base, derived]
     del entity[Base]
     assert not entity[Base]
@@ -206,6 +357,99 @@ def test_Composite() -> None:
     assert tuple(entity[object]) == (base, derived, foo)
     entity.clear()
     assert tuple(entity[object]) == ()
+    with pytest.raises(ValueError, match="not in"):
+        entity.remove(foo)
+    entity.add(derived)
+    with pytest.raises(ValueError, match="not in"):
+        entity.remove(base)
+
+
+def test_Composite_order() -> None:
+    entity = tcod.ec.Composite([derived, 1, base, "a", derived, 2])
+    assert list(entity[object]) == [derived, 1, base, "a", derived, 2]
+    assert list(entity[Base]) == [derived, base, derived]
+    assert list(entity[int]) == [1, 2]
+
+
+def test_Composite_remove_identity() -> None:
+    entity = tcod.ec.Composite([1.0, 1])
+    entity.remove(1)
+    assert list(entity[object]) == [1.0]
+    assert list(entity[float]) == [1.0]
+    assert int not in entity
+
+    entity = tcod.ec.Composite([True, 1])
+    entity.remove(1)
+    assert entity[object] == [True]
+    assert entity[bool] == [True]
+
+    first, second = Missing(), Missing()
+    entity = tcod.ec.Composite([first, second])
+    entity.remove(second)
+    assert entity[object][0] is first
+    entity.remove(Missing())  # Equal objects are still removed when no identical object is stored.
+    assert Missing not in entity
+
+    entity = tcod.ec.Composite([1.0, 1, 2.0, 2])
+    del entity[int]
+    assert list(entity[object]) == [1.0, 2.0]
+    assert list(entity[float]) == [1.0, 2.0]
+    assert int not in entity
+
+
+class AddHook(tcod.ec.Composite):
+    """Subclass for testing that an overridden add sees every component."""
+
+    __slots__ = ("added",)
+
+    def __init__(self, components: Iterable[object] = ()) -> None:
+        self.added: list[object] = []
+        super().__init__(components)
+
+    def add(self, component: object) -> None:
+        """Record and add a component."""
+        self.added.append(component)
+        super().add(component)
+
+
+def test_Composite_add_override() -> None:
+    entity = AddHook([base, foo])
+    entity.extend([derived])
+    assert entity.added == [base, foo, derived]
+    assert list(entity[object]) == [base, foo, derived]
+
+    entity.added.clear()
+    entity[Base] = [derived]
+    assert entity.added == [derived]
+    clone: AddHook = pickle.loads(pickle.dumps(entity))
+    assert clone.added == [derived, foo, derived]  # The pickled list is restored before components are re-added.
+    assert list(clone[object]) == [foo, derived]
+
+
+class RemoveHook(tcod.ec.Composite):
+    """Subclass for testing that an overridden remove sees every removal."""
+
+    __slots__ = ("removed",)
+
+    def __init__(self, components: Iterable[object] = ()) -> None:
+        self.removed: list[object] = []
+        super().__init__(components)
+
+    def remove(self, component: object) -> None:
+        """Record and remove a component."""
+        self.removed.append(component)
+        super().remove(component)
+
+
+def test_Composite_remove_override() -> None:
+    entity = RemoveHook([1, "a", 2, foo])
+    del entity[int]
+    assert entity.removed == [1, 2]
+    entity[str] = ["b"]
+    assert entity.removed == [1, 2, "a"]
+    entity.clear()
+    assert entity.removed == [1, 2, "a", foo, "b"]
+    assert list(entity[object]) == []
 
 
 def test_Composite_pickle() -> None:
@@ -230,3 +474,32 @@ def test_Composite_unpickle_v2() -> None:
     Composite_v2 = b"\x80\x04\x95f\x00\x00\x00\x00\x00\x00\x00\x8c\x07tcod.ec\x94\x8c\tComposite\x94\x93\x94)\x81\x94}\x94\x8c\x0b_components\x94]\x94(\x8c\x0ftcod.ec.test_ec\x94\x8c\x07Derived\x94\x93\x94)\x81\x94}\x94bh\x07\x8c\x03Foo\x94\x93\x94)\x81\x94}\x94besb."  # cspell: disable-line
     clone = pickle.loads(Composite_v2)
     assert repr(clone) == "Composite([Derived(), Foo()])"
+
+
+@pytest.fixture
+def _restore_abstract_components() -> Iterator[None]:
+    """Unregister the abstract components registered by a test, these are otherwise kept for every later test."""
+    abstract_components = tcod.ec._ABSTRACT_COMPONENTS.copy()  # noqa: SLF001
+    yield
+    tcod.ec._ABSTRACT_COMPONENTS.clear()  # noqa: SLF001
+    tcod.ec._ABSTRACT_COMPONENTS.update(abstract_components)  # noqa: SLF001
+    tcod.ec._COMPONENT_KEYS.clear()  # noqa: SLF001
+
+
+@pytest.mark.usefixtures("_restore_abstract_components")
+def test_abstract_component_late() -> None:
+    @attrs.define(frozen=True)
+    class LateBase:
+        pass
+
+    @attrs.define(frozen=True)
+    class LateDerived(LateBase):
+        pass
+
+    entity = tcod.ec.ComponentDict([LateDerived()])
+    assert LateDerived in entity
+    tcod.ec.abstract_component(LateBase)
+    assert LateBase in tcod.ec.ComponentDict([LateDerived()])
+    # The entity filled before registration is copied with the new keys.
+    assert LateBase in entity.copy()
+    assert LateBase in copy.copy(entity)